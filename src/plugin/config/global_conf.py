@@ -0,0 +1,2 @@
+# profile_output_dir 싱크 옵션은 이 디렉토리 하위로 제한됨
+PROFILE_OUTPUT_BASE_DIR = "/tmp/spaceone/profile"
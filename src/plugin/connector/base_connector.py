@@ -1,3 +1,9 @@
+import datetime
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
 import google.oauth2.service_account
 import googleapiclient
 import googleapiclient.discovery
@@ -7,6 +13,101 @@ from spaceone.core.connector import BaseConnector
 
 _LOGGER = logging.getLogger(__name__)
 
+# 토큰 만료 전 선제적으로 갱신할 여유 시간
+_TOKEN_REFRESH_MARGIN = datetime.timedelta(minutes=5)
+
+# 서비스 계정 키 fingerprint 별 Credentials 캐시 (프로세스 전역)
+_CREDENTIALS_CACHE = OrderedDict()
+_CREDENTIALS_CACHE_LOCK = threading.Lock()
+_CREDENTIALS_CACHE_MAX_SIZE = 100
+_CREDENTIALS_CACHE_TTL = 3600  # 마지막 사용 이후 보관 시간(초)
+
+# scope를 미리 지정해야 discovery.build가 Credentials를 복사하지 않고 그대로 사용
+_SCOPES = ["https://www.googleapis.com/auth/cloud-platform"]
+
+
+class _SharedCredentials(google.oauth2.service_account.Credentials):
+    """여러 sync가 공유하는 Credentials
+
+    모든 요청 전에 lock 안에서 만료 임박 여부를 확인하므로,
+    같은 계정에 대한 동시 요청은 하나의 refresh만 수행한다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._refresh_lock = threading.RLock()
+
+    def refresh(self, request):
+        stale_token = self.token
+        with self._refresh_lock:
+            # lock 대기 중 다른 요청이 이미 갱신한 경우 (동시 401 등) 다시 갱신하지 않음
+            if self.token != stale_token and not _needs_refresh(self):
+                return
+
+            _LOGGER.debug(
+                f"[SharedCredentials] Refreshing access token for {self.service_account_email}"
+            )
+            super().refresh(request)
+
+    def before_request(self, request, method, url, headers):
+        with self._refresh_lock:
+            if _needs_refresh(self):
+                self.refresh(request)
+        super().before_request(request, method, url, headers)
+
+
+def _get_key_fingerprint(secret_data):
+    key = "|".join(
+        [
+            secret_data.get("client_email", ""),
+            secret_data.get("private_key_id", ""),
+            secret_data.get("private_key", ""),
+        ]
+    )
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def _needs_refresh(credentials):
+    if not credentials.token or credentials.expiry is None:
+        return True
+
+    # google-auth의 expiry는 naive UTC datetime
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+    return credentials.expiry - now <= _TOKEN_REFRESH_MARGIN
+
+
+def _evict_credentials(now):
+    # 호출자가 _CREDENTIALS_CACHE_LOCK을 잡고 있어야 함
+    for fingerprint, (_, last_used) in list(_CREDENTIALS_CACHE.items()):
+        if now - last_used > _CREDENTIALS_CACHE_TTL:
+            del _CREDENTIALS_CACHE[fingerprint]
+
+    while len(_CREDENTIALS_CACHE) > _CREDENTIALS_CACHE_MAX_SIZE:
+        _CREDENTIALS_CACHE.popitem(last=False)
+
+
+def get_credentials(secret_data):
+    """서비스 계정 키 fingerprint 기준으로 Credentials를 재사용
+
+    토큰 발급은 첫 API 요청 시점에 lazy하게 수행된다.
+    """
+    fingerprint = _get_key_fingerprint(secret_data)
+    now = time.monotonic()
+
+    with _CREDENTIALS_CACHE_LOCK:
+        cached = _CREDENTIALS_CACHE.pop(fingerprint, None)
+        if cached is None:
+            credentials = _SharedCredentials.from_service_account_info(
+                secret_data, scopes=_SCOPES
+            )
+        else:
+            credentials, _ = cached
+
+        _CREDENTIALS_CACHE[fingerprint] = (credentials, now)
+        _evict_credentials(now)
+
+    return credentials
+
 
 class GoogleCloudConnector(BaseConnector):
     google_client_service = None
@@ -29,11 +130,7 @@ class GoogleCloudConnector(BaseConnector):
         super().__init__(*args, **kwargs)
         secret_data = kwargs.get("secret_data")
         self.project_id = secret_data.get("project_id")
-        self.credentials = (
-            google.oauth2.service_account.Credentials.from_service_account_info(
-                secret_data
-            )
-        )
+        self.credentials = get_credentials(secret_data)
         self.client = googleapiclient.discovery.build(
             self.google_client_service,
             self.version,
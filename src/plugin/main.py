@@ -2,6 +2,7 @@ from spaceone.identity.plugin.account_collector.lib.server import (
     AccountCollectorPluginServer,
 )
 
+from plugin.config.global_conf import PROFILE_OUTPUT_BASE_DIR
 from plugin.manager.account_collector_manager import AccountCollectorManager
 
 app = AccountCollectorPluginServer()
@@ -61,6 +62,17 @@ def account_collector_init(params: dict) -> dict:
                     "minimum": 0,
                     "description": "Depth level to start including folder location in project path. Must be less than or equal to start_depth. If not set, uses start_depth value.",
                 },
+                "profile": {
+                    "title": "Profile",
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Profile CPU (cProfile) and memory (tracemalloc) usage of sync and record timing per depth level.",
+                },
+                "profile_output_dir": {
+                    "title": "Profile Output Directory",
+                    "type": "string",
+                    "description": f"Directory to write profile results to, relative to {PROFILE_OUTPUT_BASE_DIR}. If not set, the summary is written to the log.",
+                },
             },
         }
     }
@@ -90,6 +102,14 @@ def account_collector_init(params: dict) -> dict:
             "default"
         ] = include_location_from_depth
 
+    if profile := options.get("profile"):
+        additional_options_schema["properties"]["profile"]["default"] = profile
+
+    if profile_output_dir := options.get("profile_output_dir"):
+        additional_options_schema["properties"]["profile_output_dir"]["default"] = (
+            profile_output_dir
+        )
+
     metadata["additional_options_schema"] = additional_options_schema
     return {"metadata": metadata}
 
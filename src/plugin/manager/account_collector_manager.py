@@ -1,15 +1,91 @@
+import cProfile
 import fnmatch
+import io
 import logging
+import os
+import pstats
+import threading
+import time
+import tracemalloc
 from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from functools import lru_cache
 
 from spaceone.core.manager import BaseManager
 
+from plugin.config.global_conf import PROFILE_OUTPUT_BASE_DIR
 from plugin.connector.resource_manager_v1_connector import ResourceManagerV1Connector
 from plugin.connector.resource_manager_v3_connector import ResourceManagerV3Connector
 
 _LOGGER = logging.getLogger("spaceone")
 
+_PROFILE_TOP_FUNCTIONS = 30
+_PROFILE_TOP_ALLOCATIONS = 20
+_PROFILE_TRACEMALLOC_FRAMES = 5
+
+# tracemalloc은 프로세스 전역이므로 동시에 프로파일링 중인 sync 수를 세어
+# 마지막 sync가 끝날 때만 중지
+_TRACEMALLOC_LOCK = threading.Lock()
+_tracemalloc_users = 0
+_tracemalloc_started = False
+
+
+def _acquire_tracemalloc():
+    global _tracemalloc_users, _tracemalloc_started
+    with _TRACEMALLOC_LOCK:
+        if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(_PROFILE_TRACEMALLOC_FRAMES)
+            _tracemalloc_started = True
+        _tracemalloc_users += 1
+
+
+def _release_tracemalloc():
+    """snapshot과 peak을 반환하고, 마지막 사용자인 경우 tracemalloc 중지"""
+    global _tracemalloc_users, _tracemalloc_started
+    with _TRACEMALLOC_LOCK:
+        snapshot, peak = None, None
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+
+        _tracemalloc_users -= 1
+        if _tracemalloc_users == 0 and _tracemalloc_started:
+            tracemalloc.stop()
+            _tracemalloc_started = False
+
+        return snapshot, peak
+
+
+class _SyncProfiler:
+    """cProfile 래퍼
+
+    Python 3.12+에서는 다른 프로파일러가 이미 활성화되어 있으면 enable()이 실패하므로,
+    이 경우 CPU 프로파일링을 생략하고 메모리 프로파일링만 수행한다.
+    """
+
+    def __init__(self):
+        self.profile = cProfile.Profile()
+        self.is_available = True
+        self.has_stats = False
+
+    def enable(self):
+        if not self.is_available:
+            return
+
+        try:
+            self.profile.enable()
+            self.has_stats = True
+        except ValueError as e:
+            _LOGGER.warning(
+                f"[SyncProfiler] CPU profiling unavailable, profiling memory only: {e}"
+            )
+            self.is_available = False
+
+    def disable(self):
+        if self.is_available:
+            self.profile.disable()
+
 
 class AccountCollectorManager(BaseManager):
     def __init__(self, *args, **kwargs):
@@ -37,6 +113,20 @@ class AccountCollectorManager(BaseManager):
                 f"include_location_from_depth ({self.include_location_from_depth}) "
                 f"cannot be greater than start_depth ({self.start_depth})"
             )
+
+        self.profile = self.options.get("profile", False)
+        self.profile_output_dir = None
+        if profile_output_dir := self.options.get("profile_output_dir"):
+            # profile_output_dir은 PROFILE_OUTPUT_BASE_DIR 하위로 제한
+            base_dir = os.path.realpath(PROFILE_OUTPUT_BASE_DIR)
+            self.profile_output_dir = os.path.realpath(
+                os.path.join(base_dir, str(profile_output_dir))
+            )
+            if os.path.commonpath([base_dir, self.profile_output_dir]) != base_dir:
+                raise ValueError(
+                    f"profile_output_dir ({profile_output_dir}) "
+                    f"must be under {PROFILE_OUTPUT_BASE_DIR}"
+                )
         self.secret_data = kwargs["secret_data"]
         self.trusted_service_account = self.secret_data["client_email"]
 
@@ -47,10 +137,15 @@ class AccountCollectorManager(BaseManager):
             secret_data=self.secret_data
         )
         self.results = []
+        # batch 단위로 이미 내보낸 결과 수
+        self.flushed_count = 0
 
         # 방문 기록을 위한 set
         self.visited_folders = set()
 
+        # BFS 레벨별 처리 시간 기록
+        self.level_timings = []
+
     def sync(self) -> list:
         """sync Google Cloud resources
             :Returns:
@@ -65,6 +160,47 @@ class AccountCollectorManager(BaseManager):
                 }
         ]
         """
+        if self.profile:
+            with self._profile_sync():
+                return self._sync()
+        return self._sync()
+
+    def sync_batches(self, batch_size: int):
+        """sync Google Cloud resources in batches
+            :Returns:
+                generator of results [...]  # 최대 batch_size 개의 결과 (sync와 동일한 형식)
+
+        내보낸 결과는 메모리에서 제거되며, 프로젝트 목록 캐시도 사용하지 않는다.
+        폴더 목록 캐시(_get_folders_cached)는 유지된다.
+        """
+        batch_size = int(batch_size)
+        if batch_size <= 0:
+            raise ValueError(f"batch_size ({batch_size}) must be greater than 0")
+
+        return self._iter_batches(batch_size)
+
+    def _iter_batches(self, batch_size: int):
+        if self.profile:
+            # batch를 소비하는 동안은 프로파일링을 멈춰 sync 작업만 측정
+            with self._profile_sync() as profiler:
+                for results in self._iter_sync(batch_size):
+                    profiler.disable()
+                    yield results
+                    profiler.enable()
+        else:
+            yield from self._iter_sync(batch_size)
+
+    @property
+    def collected_count(self):
+        return self.flushed_count + len(self.results)
+
+    def _sync(self) -> list:
+        # batch_size 없이 실행하면 전체 결과가 self.results에 누적됨
+        for _ in self._iter_sync():
+            pass
+        return self.results
+
+    def _iter_sync(self, batch_size: int = 0):
         _LOGGER.info(
             f"[sync] Starting sync process with start_depth: {self.start_depth}, "
             f"include_location_from_depth: {self.include_location_from_depth}"
@@ -72,6 +208,8 @@ class AccountCollectorManager(BaseManager):
 
         projects_info = self.resource_manager_v1_connector.list_projects()
         organization_info = self._get_organization_info(projects_info)
+        # v1 프로젝트 목록은 조직 조회에만 사용하므로 generator 수명 동안 유지하지 않음
+        del projects_info
 
         parent = organization_info["name"]
         _LOGGER.info(
@@ -83,9 +221,15 @@ class AccountCollectorManager(BaseManager):
 
         # 방문 기록 초기화
         self.visited_folders.clear()
+        self.level_timings = []
+        self.results = []
+        self.flushed_count = 0
 
+        level_depth = 0
         while queue:
             level_size = len(queue)
+            level_started_at = time.perf_counter()
+            level_results = self.collected_count
 
             for _ in range(level_size):
                 parent, current_locations, current_depth = queue.popleft()
@@ -98,7 +242,15 @@ class AccountCollectorManager(BaseManager):
                     _LOGGER.debug(
                         f"[sync] Collecting projects at depth {current_depth} (start_depth: {self.start_depth})"
                     )
-                    self._create_project_response(parent, current_locations)
+                    # batch 모드에서는 내보낸 프로젝트 목록이 캐시에 남지 않도록 캐시 미사용
+                    self._create_project_response(
+                        parent, current_locations, use_cache=not batch_size
+                    )
+                    if batch_size:
+                        # batch 소비 시간은 레벨 처리 시간에서 제외
+                        flush_started_at = time.perf_counter()
+                        yield from self._flush_results(batch_size)
+                        level_started_at += time.perf_counter() - flush_started_at
                 else:
                     _LOGGER.debug(
                         f"[sync] Skipping project collection at depth {current_depth} (start_depth: {self.start_depth})"
@@ -152,10 +304,109 @@ class AccountCollectorManager(BaseManager):
                             f"[sync] Excluding folder: {folder_name} (ID: {folder_id})"
                         )
 
+            self._record_level_timing(
+                level_depth, level_size, level_started_at, level_results
+            )
+            level_depth += 1
+
         _LOGGER.info(
-            f"[sync] Sync completed. Total projects collected: {len(self.results)}"
+            f"[sync] Sync completed. Total projects collected: {self.collected_count}"
+        )
+
+        if batch_size and self.results:
+            yield from self._flush_results(len(self.results))
+
+    def _flush_results(self, batch_size):
+        while len(self.results) >= batch_size:
+            batch = self.results[:batch_size]
+            del self.results[:batch_size]
+            self.flushed_count += len(batch)
+            yield batch
+
+    def _record_level_timing(self, depth, nodes, started_at, results_before):
+        level_timing = {
+            "depth": depth,
+            "nodes": nodes,
+            "projects": self.collected_count - results_before,
+            "elapsed_seconds": round(time.perf_counter() - started_at, 3),
+        }
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            level_timing["traced_memory_bytes"] = current
+            level_timing["traced_memory_peak_bytes"] = peak
+
+        self.level_timings.append(level_timing)
+        _LOGGER.debug(f"[sync] Level completed: {level_timing}")
+
+    @contextmanager
+    def _profile_sync(self):
+        """cProfile, tracemalloc으로 sync를 감싸 CPU/메모리 프로파일 수집"""
+        _LOGGER.info(
+            f"[profile_sync] Profiling enabled (output_dir: {self.profile_output_dir or 'log'})"
         )
-        return self.results
+
+        _acquire_tracemalloc()
+
+        profiler = _SyncProfiler()
+        try:
+            profiler.enable()
+            yield profiler
+        finally:
+            profiler.disable()
+            try:
+                snapshot, peak = _release_tracemalloc()
+                self._report_profile(profiler, snapshot, peak)
+            except Exception as e:
+                _LOGGER.error(f"[profile_sync] Failed to report profile: {e}")
+
+    def _report_profile(self, profiler, snapshot, peak):
+        stats_stream = io.StringIO()
+        if profiler.has_stats:
+            stats = pstats.Stats(profiler.profile, stream=stats_stream)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(
+                _PROFILE_TOP_FUNCTIONS
+            )
+            profiled_time = f"{stats.total_tt:.3f}s"
+        else:
+            stats_stream.write("CPU profiling unavailable (another profiler is active)\n")
+            profiled_time = "N/A"
+
+        top_allocations = []
+        if snapshot:
+            top_allocations = snapshot.statistics("lineno")[:_PROFILE_TOP_ALLOCATIONS]
+
+        summary_lines = [
+            f"Total profiled time: {profiled_time}",
+            f"Total projects: {self.collected_count}",
+            # 동시에 프로파일링 중인 sync가 있으면 해당 sync의 할당도 포함됨
+            f"Traced memory peak: {peak} bytes",
+            "",
+            "[Level timings]",
+            *[str(level_timing) for level_timing in self.level_timings],
+            "",
+            f"[Top {_PROFILE_TOP_ALLOCATIONS} allocation sites]",
+            *[str(stat) for stat in top_allocations],
+        ]
+        summary = "\n".join(summary_lines)
+
+        if self.profile_output_dir:
+            os.makedirs(self.profile_output_dir, exist_ok=True)
+            prefix = os.path.join(
+                self.profile_output_dir,
+                f"sync_{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S%f')}",
+            )
+            if profiler.has_stats:
+                profiler.profile.dump_stats(f"{prefix}.prof")
+            with open(f"{prefix}_summary.txt", "w") as f:
+                f.write(summary)
+                f.write("\n\n[Top functions by cumulative time]\n")
+                f.write(stats_stream.getvalue())
+            _LOGGER.info(f"[report_profile] Profile written to {prefix}_summary.txt")
+        else:
+            _LOGGER.info(
+                f"[report_profile] Sync profile summary\n{summary}\n\n"
+                f"[Top functions by cumulative time]\n{stats_stream.getvalue()}"
+            )
 
     @lru_cache(maxsize=100)
     def _get_folders_cached(self, parent):
@@ -345,8 +596,11 @@ class AccountCollectorManager(BaseManager):
 
         return result
 
-    def _create_project_response(self, parent, locations):
-        projects_info = self._get_projects_cached(parent)
+    def _create_project_response(self, parent, locations, use_cache=True):
+        if use_cache:
+            projects_info = self._get_projects_cached(parent)
+        else:
+            projects_info = self.resource_manager_v3_connector.list_projects(parent)
 
         _LOGGER.debug(
             f"[create_project_response] Checking projects for parent: {parent}"
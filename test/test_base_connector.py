@@ -0,0 +1,41 @@
+import pytest
+
+pytest.importorskip("googleapiclient")
+pytest.importorskip("spaceone.core")
+serialization = pytest.importorskip("cryptography.hazmat.primitives.serialization")
+rsa = pytest.importorskip("cryptography.hazmat.primitives.asymmetric.rsa")
+
+from plugin.connector.base_connector import get_credentials
+from plugin.connector.resource_manager_v1_connector import ResourceManagerV1Connector
+from plugin.connector.resource_manager_v3_connector import ResourceManagerV3Connector
+
+
+@pytest.fixture
+def secret_data():
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return {
+        "type": "service_account",
+        "project_id": "test-project",
+        "private_key_id": "test-key-id",
+        "private_key": private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        ).decode("utf-8"),
+        "client_email": "collector@test-project.iam.gserviceaccount.com",
+        "token_uri": "https://oauth2.googleapis.com/token",
+    }
+
+
+def test_connectors_share_cached_credentials(secret_data):
+    credentials = get_credentials(secret_data)
+
+    v1_connector = ResourceManagerV1Connector(secret_data=secret_data)
+    v3_connector = ResourceManagerV3Connector(secret_data=secret_data)
+
+    assert v1_connector.client._http.credentials is credentials
+    assert v3_connector.client._http.credentials is credentials
+    assert (
+        ResourceManagerV3Connector(secret_data=secret_data).client._http.credentials
+        is credentials
+    )